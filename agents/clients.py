@@ -0,0 +1,79 @@
+"""Shared API clients for the research stages.
+
+Each SDK client owns its own HTTP connection pool, so the stages share one
+instance per provider instead of opening separate pools to the same hosts.
+"""
+
+import functools
+
+import anthropic
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from openai import OpenAI  # type: ignore
+except Exception:  # OpenAI optional
+    OpenAI = None  # type: ignore
+from tavily import TavilyClient
+
+from agents.config import config
+
+HAS_OPENAI = OpenAI is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_anthropic_client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client."""
+    return anthropic.Anthropic(api_key=config.api.anthropic_api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client():
+    """Return the shared OpenAI client (requires the optional openai package)."""
+    return OpenAI(api_key=config.api.openai_api_key)  # type: ignore
+
+
+@functools.lru_cache(maxsize=1)
+def get_tavily_client() -> TavilyClient:
+    """Return the shared Tavily search client."""
+    return TavilyClient(api_key=config.api.tavily_api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def get_perplexity_session() -> requests.Session:
+    """
+    Return the shared HTTP session for the Perplexity API.
+
+    The session carries the API key and keeps connections alive across
+    calls, with a pool sized for the Tier 2 workers. It retries connection
+    failures and 429/503 responses, which mean the request was turned away
+    before any research ran. Read timeouts and other server errors are not
+    retried: a deep research call can run for minutes, and a 502 or 504 may
+    arrive after it finished, so repeating it would double the cost.
+
+    The Tier 2 workers share this session. That is safe because it is only
+    used for POSTs whose headers are fixed here, urllib3's connection pool
+    is thread-safe, and the cookie jar guards itself with a lock.
+    """
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=1,
+        # Spread retries from concurrent workers instead of retrying in step
+        backoff_jitter=1.0,
+        backoff_max=30,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({"POST"}),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=max(1, config.research.tier2_concurrency),
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {config.api.perplexity_api_key}"
+    session.mount("https://", adapter)
+    return session
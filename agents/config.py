@@ -68,6 +68,12 @@ class ResearchConfig(BaseModel):
     tier1_queries_per_market: int = Field(
         default=3, description="Number of search queries per market"
     )
+    tier1_concurrency: int = Field(
+        default=6, description="Markets researched in parallel in Tier 1"
+    )
+    search_concurrency: int = Field(
+        default=8, description="Search queries run in parallel per market"
+    )
     tier1_model: str = Field(
         default="claude-3-5-haiku-20241022", description="Model for Tier 1 analysis"
     )
@@ -86,6 +92,9 @@ class ResearchConfig(BaseModel):
     tier2_queries_per_market: int = Field(
         default=8, description="Number of search queries per market"
     )
+    tier2_concurrency: int = Field(
+        default=4, description="Markets researched in parallel in Tier 2"
+    )
     tier2_model: str = Field(
         default="claude-3-5-sonnet-20241022", description="Model for Tier 2 analysis"
     )
@@ -212,6 +221,9 @@ class LoggingConfig(BaseModel):
     log_file_prefix: str = Field(
         default="polymarket_agent", description="Prefix for log files"
     )
+    log_retention_days: int = Field(
+        default=30, description="Number of daily log files to keep"
+    )
 
     # Data logging
     data_log_dir: str = Field(
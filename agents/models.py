@@ -1,11 +1,16 @@
 """Data models for Polymarket Trading Agent."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
 
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class ConfidenceLevel(str, Enum):
     """Confidence level enum."""
 
@@ -67,6 +72,11 @@ class Source(BaseModel):
     relevance_score: Optional[float] = None
 
 
+def source_rank(source: Source) -> tuple:
+    """Ranking key for sources: credibility first, then search relevance."""
+    return (source.credibility, source.relevance_score or 0)
+
+
 class ResearchFinding(BaseModel):
     """Individual research finding."""
 
@@ -88,7 +98,7 @@ class Tier1Research(BaseModel):
     """Tier 1 (Fast) research results."""
 
     market_id: str
-    research_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    research_timestamp: datetime = Field(default_factory=_utcnow)
 
     # Search results
     queries_used: list[str]
@@ -113,7 +123,7 @@ class Tier2Research(BaseModel):
 
     market_id: str
     question: str
-    research_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    research_timestamp: datetime = Field(default_factory=_utcnow)
 
     # Model estimate
     model_estimate: ProbabilityEstimate
@@ -3,6 +3,7 @@
 This module coordinates all stages of the research and reporting pipeline.
 """
 
+import heapq
 import logging
 import time
 from datetime import datetime, timezone
@@ -20,6 +21,12 @@ from agents.stages.email_sender import EmailSender, DataLogger
 
 logger = logging.getLogger(__name__)
 
+# Rough per-market API cost estimates (USD), based on token usage:
+# Tier 1: ~2000 tokens on Claude 3.5 Haiku (~$0.002) + 3 Tavily searches (~$0.001 each)
+# Tier 2: ~8000 tokens on Claude 3.5 Sonnet (~$0.04) + 8 Tavily searches (~$0.001 each)
+_TIER1_COST_PER_MARKET = 0.002 + 3 * 0.001
+_TIER2_COST_PER_MARKET = 0.04 + 8 * 0.001
+
 
 class Orchestrator:
     """
@@ -54,7 +61,7 @@ class Orchestrator:
         Returns:
             DailyRun object with results.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         run_date = datetime.now(timezone.utc)
 
         logger.info("=" * 80)
@@ -66,99 +73,106 @@ class Orchestrator:
         errors = []
         opportunities = []
 
+        # Per-stage counts for the run record, updated as stages complete
+        markets_fetched = 0
+        markets_after_filtering = 0
+        markets_tier1_researched = 0
+        markets_tier2_researched = 0
+        estimated_cost = 0
+
         try:
             # Stage 1: Fetch Markets
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info("\n[STAGE 1] Fetching markets...")
             markets = self.market_fetcher.fetch_all_markets()
-            stage_duration = time.time() - stage_start
+            markets_fetched = len(markets)
+            stage_duration = time.perf_counter() - stage_start
             logger.info(
                 f"✓ Stage 1 complete: {len(markets)} markets fetched ({stage_duration:.1f}s)"
             )
 
             # Stage 2: Filter Markets
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info("\n[STAGE 2] Filtering markets...")
             filtered_markets = self.market_filter.filter_markets(markets)
-            stage_duration = time.time() - stage_start
+            stage_duration = time.perf_counter() - stage_start
 
-            # Limit to configured maximum
-            filtered_markets = sorted(
-                filtered_markets, key=lambda m: m.volume, reverse=True
-            )[: config.scheduler.max_markets_to_filter]
+            # Limit to configured maximum, keeping the highest-volume markets
+            filtered_markets = heapq.nlargest(
+                config.scheduler.max_markets_to_filter,
+                filtered_markets,
+                key=lambda m: m.volume,
+            )
+            markets_after_filtering = len(filtered_markets)
 
             logger.info(
                 f"✓ Stage 2 complete: {len(filtered_markets)} markets after filtering and capping ({stage_duration:.1f}s)"
             )
 
             # Stage 3: Tier 1 Research
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info(
                 f"\n[STAGE 3] Tier 1 research on {len(filtered_markets)} markets..."
             )
-            tier1_results = []
+            # Tier 2 candidates are selected in the same pass
+            tier2_candidates = []
 
-            for i, market in enumerate(filtered_markets, 1):
-                try:
-                    logger.info(
-                        f"  [{i}/{len(filtered_markets)}] Researching: {market.question[:60]}..."
-                    )
-                    result = self.tier1_researcher.research_market(market)
-                    tier1_results.append((market, result))
-                except Exception as e:
-                    error_msg = f"Tier 1 research failed for market {market.id}: {e}"
+            research_results = self.tier1_researcher.research_markets(filtered_markets)
+
+            for market, result in zip(filtered_markets, research_results):
+                if isinstance(result, Exception):
+                    error_msg = f"Tier 1 research failed for market {market.id}: {result}"
                     logger.error(error_msg)
                     errors.append(error_msg)
+                    continue
 
-            # Filter for Tier 2 candidates
-            tier2_candidates = [
-                (market, result)
-                for market, result in tier1_results
-                if result.proceed_to_tier2
-            ]
+                markets_tier1_researched += 1
+                if result.proceed_to_tier2:
+                    tier2_candidates.append((market, result))
 
-            stage_duration = time.time() - stage_start
+            stage_duration = time.perf_counter() - stage_start
             logger.info(
                 f"✓ Stage 3 complete: {len(tier2_candidates)} markets selected for deep research ({stage_duration:.1f}s)"
             )
 
             # Stage 4: Tier 2 Research
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             max_deep = config.scheduler.max_markets_for_deep_research
 
             if len(tier2_candidates) > max_deep:
                 logger.info(f"Limiting deep research to {max_deep} markets")
-                # Sort by preliminary edge if available
-                tier2_candidates = sorted(
+                # Keep the highest preliminary edges if available
+                tier2_candidates = heapq.nlargest(
+                    max_deep,
                     tier2_candidates,
                     key=lambda x: x[1].preliminary_edge or 0,
-                    reverse=True,
-                )[:max_deep]
+                )
 
             logger.info(
                 f"\n[STAGE 4] Tier 2 deep research on {len(tier2_candidates)} markets..."
             )
             tier2_results = []
+            tier2_markets = [market for market, _ in tier2_candidates]
 
-            for i, (market, _) in enumerate(tier2_candidates, 1):
-                try:
-                    logger.info(
-                        f"  [{i}/{len(tier2_candidates)}] Deep research: {market.question[:60]}..."
-                    )
-                    result = self.tier2_researcher.research_market(market)
-                    tier2_results.append((market, result))
-                except Exception as e:
-                    error_msg = f"Tier 2 research failed for market {market.id}: {e}"
+            research_results = self.tier2_researcher.research_markets(tier2_markets)
+
+            for market, result in zip(tier2_markets, research_results):
+                if isinstance(result, Exception):
+                    error_msg = f"Tier 2 research failed for market {market.id}: {result}"
                     logger.error(error_msg)
                     errors.append(error_msg)
+                else:
+                    tier2_results.append((market, result))
+
+            markets_tier2_researched = len(tier2_results)
 
-            stage_duration = time.time() - stage_start
+            stage_duration = time.perf_counter() - stage_start
             logger.info(
                 f"✓ Stage 4 complete: {len(tier2_results)} markets researched deeply ({stage_duration:.1f}s)"
             )
 
             # Stage 5: Opportunity Analysis
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info(f"\n[STAGE 5] Analyzing {len(tier2_results)} opportunities...")
 
             for market, research in tier2_results:
@@ -178,16 +192,16 @@ class Orchestrator:
             # Rank opportunities
             opportunities = self.opportunity_analyzer.rank_opportunities(opportunities)
 
-            stage_duration = time.time() - stage_start
+            stage_duration = time.perf_counter() - stage_start
             logger.info(
                 f"✓ Stage 5 complete: {len(opportunities)} opportunities identified ({stage_duration:.1f}s)"
             )
 
             # Stage 6: Report Generation
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info("\n[STAGE 6] Generating report...")
 
-            total_duration = time.time() - start_time
+            total_duration = time.perf_counter() - start_time
             estimated_cost = self._estimate_cost(
                 len(filtered_markets), len(tier2_results)
             )
@@ -200,11 +214,11 @@ class Orchestrator:
                 errors=errors,
             )
 
-            stage_duration = time.time() - stage_start
+            stage_duration = time.perf_counter() - stage_start
             logger.info(f"✓ Stage 6 complete: Report generated ({stage_duration:.1f}s)")
 
             # Stage 7: Email Delivery
-            stage_start = time.time()
+            stage_start = time.perf_counter()
             logger.info("\n[STAGE 7] Sending email report...")
 
             subject = f"Polymarket Research Report - {len(opportunities)} Opportunities"
@@ -216,7 +230,7 @@ class Orchestrator:
 
             if email_sent:
                 logger.info(
-                    f"✓ Stage 7 complete: Email sent ({time.time() - stage_start:.1f}s)"
+                    f"✓ Stage 7 complete: Email sent ({time.perf_counter() - stage_start:.1f}s)"
                 )
             else:
                 error_msg = "Failed to send email report"
@@ -229,24 +243,18 @@ class Orchestrator:
             errors.append(error_msg)
 
         # Create daily run record
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
 
         daily_run = DailyRun(
             run_date=run_date,
             run_start_time=run_date,
             run_end_time=datetime.now(timezone.utc),
-            markets_fetched=len(markets) if "markets" in locals() else 0,
-            markets_after_filtering=(
-                len(filtered_markets) if "filtered_markets" in locals() else 0
-            ),
-            markets_tier1_researched=(
-                len(tier1_results) if "tier1_results" in locals() else 0
-            ),
-            markets_tier2_researched=(
-                len(tier2_results) if "tier2_results" in locals() else 0
-            ),
+            markets_fetched=markets_fetched,
+            markets_after_filtering=markets_after_filtering,
+            markets_tier1_researched=markets_tier1_researched,
+            markets_tier2_researched=markets_tier2_researched,
             opportunities_identified=len(opportunities),
-            total_cost=estimated_cost if "estimated_cost" in locals() else 0,
+            total_cost=estimated_cost,
             opportunities=opportunities,
             errors=errors,
             timing={
@@ -256,7 +264,7 @@ class Orchestrator:
 
         # Log to file
         try:
-            self.data_logger.log_daily_run(daily_run.model_dump())
+            self.data_logger.log_daily_run(daily_run)
         except Exception as e:
             logger.error(f"Failed to log daily run data: {e}")
 
@@ -280,17 +288,9 @@ class Orchestrator:
         Returns:
             Estimated cost in USD.
         """
-        # Rough estimates based on token usage
-        # Tier 1: ~2000 tokens @ $0.80/1M input + $4/1M output (Claude 3.5 Haiku) = ~$0.002 per market
-        # Tier 2: ~8000 tokens @ $3/1M input + $15/1M output (Claude 3.5 Sonnet) = ~$0.04 per market
-        # Tavily: ~$0.001 per search
-
-        tier1_llm_cost = tier1_count * 0.002
-        tier1_search_cost = tier1_count * 3 * 0.001  # 3 searches per market
-
-        tier2_llm_cost = tier2_count * 0.04
-        tier2_search_cost = tier2_count * 8 * 0.001  # 8 searches per market
-
-        total = tier1_llm_cost + tier1_search_cost + tier2_llm_cost + tier2_search_cost
+        total = (
+            tier1_count * _TIER1_COST_PER_MARKET
+            + tier2_count * _TIER2_COST_PER_MARKET
+        )
 
         return round(total, 2)
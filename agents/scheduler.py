@@ -10,6 +10,10 @@ from agents.orchestrator import Orchestrator
 
 logger = logging.getLogger(__name__)
 
+# Longest single sleep between schedule checks, so a suspended host or a
+# wall-clock change delays the run by at most this much
+_MAX_IDLE_SECONDS = 3600
+
 
 class DailyScheduler:
     """
@@ -45,7 +49,9 @@ class DailyScheduler:
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep until the next job is due instead of polling
+                idle_seconds = schedule.idle_seconds()
+                time.sleep(min(max(idle_seconds, 0), _MAX_IDLE_SECONDS))
 
         except KeyboardInterrupt:
             logger.info("\nScheduler stopped by user")
@@ -0,0 +1,64 @@
+"""Bounded concurrent research shared by the Tier 1 and Tier 2 stages."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar, Union
+
+from agents.models import Market
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def research_concurrently(
+    research_fn: Callable[[Market], T],
+    markets: list[Market],
+    max_workers: int,
+    label: str,
+) -> list[Union[T, Exception]]:
+    """
+    Research several markets on a bounded thread pool.
+
+    Each market is logged as `[i/N] <label>: <question>` when a worker picks
+    it up, so the log follows the research as it happens.
+
+    Args:
+        research_fn: Callable that researches a single market.
+        markets: Markets to research.
+        max_workers: Maximum number of markets researched at once.
+        label: Progress log label, e.g. "Researching".
+
+    Returns:
+        One entry per market, in input order: the research result, or the
+        exception raised while researching that market.
+    """
+    if not markets:
+        return []
+
+    total = len(markets)
+
+    def run(index: int, market: Market) -> T:
+        logger.info("  [%d/%d] %s: %s...", index, total, label, market.question[:60])
+        return research_fn(market)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        try:
+            futures = [
+                executor.submit(run, i, market)
+                for i, market in enumerate(markets, 1)
+            ]
+
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+        except BaseException:
+            # On Ctrl+C, drop the queued markets instead of researching (and
+            # paying for) every one before the interrupt takes effect
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return results
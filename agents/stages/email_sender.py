@@ -7,13 +7,52 @@ from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from typing import Optional
 import json
+import os
+import uuid
 from pathlib import Path
 import re
 
+from pydantic_core import to_json
+
 from agents.config import config
+from agents.models import DailyRun
 
 logger = logging.getLogger(__name__)
 
+# Run fields copied into the append-only run index
+_RUN_SUMMARY_FIELDS = (
+    "run_date",
+    "markets_fetched",
+    "markets_after_filtering",
+    "markets_tier1_researched",
+    "markets_tier2_researched",
+    "opportunities_identified",
+    "total_cost",
+    "timing",
+)
+
+
+# Ordered HTML-to-plain-text rewrites, compiled once at import
+_PLAIN_TEXT_SUBSTITUTIONS = (
+    # Remove style and script tags
+    (re.compile(r"<style[^>]*>.*?</style>", re.DOTALL), ""),
+    (re.compile(r"<script[^>]*>.*?</script>", re.DOTALL), ""),
+    # Replace common HTML tags with text equivalents
+    (re.compile(r"<br\s*/?>"), "\n"),
+    (re.compile(r"<h1[^>]*>(.*?)</h1>"), r"\n\n=== \1 ===\n"),
+    (re.compile(r"<h2[^>]*>(.*?)</h2>"), r"\n\n--- \1 ---\n"),
+    (re.compile(r"<h3[^>]*>(.*?)</h3>"), r"\n\n\1:\n"),
+    (re.compile(r"<p[^>]*>(.*?)</p>"), r"\1\n"),
+    (re.compile(r"<li[^>]*>(.*?)</li>"), r"• \1\n"),
+    (re.compile(r"<strong[^>]*>(.*?)</strong>"), r"**\1**"),
+    (re.compile(r"<em[^>]*>(.*?)</em>"), r"_\1_"),
+    # Remove all other HTML tags
+    (re.compile(r"<[^>]+>"), ""),
+    # Clean up whitespace and add some structure
+    (re.compile(r"\n\s*\n\s*\n"), "\n\n"),
+    (re.compile(r"^\s+", re.MULTILINE), ""),
+)
+
 
 class EmailSender:
     """Sends HTML email reports."""
@@ -71,12 +110,10 @@ class EmailSender:
             # Create plain text fallback first (lower priority)
             plain_text = self._html_to_plain_text(html_content)
             text_part = MIMEText(plain_text, "plain", "utf-8")
-            text_part.add_header("Content-Type", "text/plain; charset=utf-8")
             message.attach(text_part)
 
             # Attach HTML content second (higher priority)
             html_part = MIMEText(html_content, "html", "utf-8")
-            html_part.add_header("Content-Type", "text/html; charset=utf-8")
             message.attach(html_part)
 
             # Connect to SMTP server and send
@@ -113,26 +150,9 @@ class EmailSender:
             Plain text version.
         """
 
-        # Remove style and script tags
-        text = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL)
-        text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL)
-
-        # Replace common HTML tags with text equivalents
-        text = re.sub(r"<br\s*/?>", "\n", text)
-        text = re.sub(r"<h1[^>]*>(.*?)</h1>", r"\n\n=== \1 ===\n", text)
-        text = re.sub(r"<h2[^>]*>(.*?)</h2>", r"\n\n--- \1 ---\n", text)
-        text = re.sub(r"<h3[^>]*>(.*?)</h3>", r"\n\n\1:\n", text)
-        text = re.sub(r"<p[^>]*>(.*?)</p>", r"\1\n", text)
-        text = re.sub(r"<li[^>]*>(.*?)</li>", r"• \1\n", text)
-        text = re.sub(r"<strong[^>]*>(.*?)</strong>", r"**\1**", text)
-        text = re.sub(r"<em[^>]*>(.*?)</em>", r"_\1_", text)
-
-        # Remove all other HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-
-        # Clean up whitespace and add some structure
-        text = re.sub(r"\n\s*\n\s*\n", "\n\n", text)
-        text = re.sub(r"^\s+", "", text, flags=re.MULTILINE)
+        text = html
+        for pattern, replacement in _PLAIN_TEXT_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
         text = text.strip()
 
         # Add header for plain text version
@@ -149,15 +169,16 @@ class DataLogger:
         self.config = config.logging
         self.log_dir = self.config.data_log_dir
 
-    def log_daily_run(self, run_data: dict) -> bool:
+    def log_daily_run(self, daily_run: DailyRun) -> bool:
         """
         Log daily run data to JSON file.
 
         Args:
-            run_data: Dictionary with run data (from DailyRun model).
+            daily_run: DailyRun model for the completed run.
 
         Returns:
-            True if logged successfully.
+            True if the run file was written. A failure to append the run
+            summary is logged but does not change the result.
         """
 
         try:
@@ -165,21 +186,62 @@ class DataLogger:
             Path(self.log_dir).mkdir(parents=True, exist_ok=True)
 
             # Generate filename with date
-            date_str = run_data.get("run_date", datetime.now().isoformat())
-            if isinstance(date_str, datetime):
-                date_str = date_str.strftime("%Y-%m-%d")
-            else:
-                date_str = date_str[:10]  # Take just date part
-
+            date_str = daily_run.run_date.strftime("%Y-%m-%d")
             filename = f"{self.log_dir}/run_{date_str}.json"
 
-            # Write JSON file
-            with open(filename, "w") as f:
-                json.dump(run_data, f, indent=2, default=str)
+            # Serialize straight from the model to UTF-8 bytes; pydantic encodes
+            # the nested opportunities and research without building an
+            # intermediate dict or str
+            self._write_atomic(filename, to_json(daily_run, indent=2))
 
             logger.info(f"Daily run data logged to {filename}")
-            return True
 
         except Exception as e:
             logger.error(f"Failed to log daily run data: {e}")
             return False
+
+        try:
+            # Daily files are overwritten by same-day reruns; the index keeps
+            # one summary line per run
+            self._append_run_summary(daily_run)
+        except Exception as e:
+            logger.error(f"Failed to append run summary to the run index: {e}")
+
+        return True
+
+    def _write_atomic(self, filename: str, content: bytes) -> None:
+        """
+        Replace a file's contents without exposing a partially written file.
+
+        The data is written to a temporary file in the same directory and
+        renamed over the target. The logs can be regenerated, so the write
+        is not fsynced; the rename only guarantees readers never see a
+        truncated file. The temporary file is created with mode 0666 so the
+        umask applies, as it would for a plain open().
+
+        Args:
+            filename: Destination path.
+            content: Encoded bytes to write.
+        """
+        tmp_path = f"{self.log_dir}/.tmp-{uuid.uuid4().hex}.json"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, filename)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _append_run_summary(self, daily_run: DailyRun) -> None:
+        """
+        Append a one-line summary of the run to the run index.
+
+        Args:
+            daily_run: DailyRun model for the completed run.
+        """
+        summary = daily_run.model_dump(mode="json", include=set(_RUN_SUMMARY_FIELDS))
+        summary["errors"] = len(daily_run.errors)
+
+        with open(f"{self.log_dir}/runs.jsonl", "a") as f:
+            f.write(json.dumps(summary) + "\n")
@@ -2,9 +2,9 @@
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Any, Optional
 import httpx
-import json
+from pydantic_core import from_json
 
 
 from agents.config import config
@@ -29,21 +29,19 @@ class MarketFetcher:
             List of Market objects.
         """
 
+        # Derive the whole query window from a single timestamp
+        now = datetime.now(timezone.utc)
         start_date_min = (
-            datetime.now(timezone.utc)
-            - timedelta(days=config.filter.max_market_age_days)
+            now - timedelta(days=config.filter.max_market_age_days)
         ).isoformat()
         start_date_max = (
-            datetime.now(timezone.utc)
-            - timedelta(days=config.filter.min_market_age_days)
+            now - timedelta(days=config.filter.min_market_age_days)
         ).isoformat()
         min_resolution_date = (
-            datetime.now(timezone.utc)
-            + timedelta(days=config.filter.min_resolution_days)
+            now + timedelta(days=config.filter.min_resolution_days)
         ).isoformat()
         max_resolution_date = (
-            datetime.now(timezone.utc)
-            + timedelta(days=config.filter.max_resolution_days)
+            now + timedelta(days=config.filter.max_resolution_days)
         ).isoformat()
 
         params = {
@@ -62,12 +60,14 @@ class MarketFetcher:
                 self.markets_endpoint, params=params, timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            # pydantic-core's parser is much faster than stdlib json on the
+            # full markets payload
+            data = from_json(response.content)
 
             markets = []
             for market_data in data:
                 try:
-                    market = self._parse_market(market_data)
+                    market = self._parse_market(market_data, now)
                     if market:
                         markets.append(market)
                 except Exception as e:
@@ -85,12 +85,14 @@ class MarketFetcher:
             logger.error(f"Unexpected error fetching markets: {e}")
             raise
 
-    def _parse_market(self, data: dict) -> Optional[Market]:
+    def _parse_market(self, data: dict, now: datetime) -> Optional[Market]:
         """
         Parse raw market data from API into Market model.
 
         Args:
             data: Raw market data from API.
+            now: Reference time for age and time-to-resolution, shared by
+                every market in a fetch.
 
         Returns:
             Market object or None if parsing fails.
@@ -112,73 +114,51 @@ class MarketFetcher:
             start_date = self._parse_date(data.get("startDate"))
 
             if not end_date:
-                logger.debug(f"Market {market_id} has no end date, skipping")
+                logger.debug("Market %s has no end date, skipping", market_id)
                 return None
 
             # Extract metrics - use numeric versions if available
             volume = float(data.get("volumeNum", data.get("volume", 0)))
             liquidity = float(data.get("liquidityNum", data.get("liquidity", 0)))
 
-            # Extract outcomes - handle both string and list formats
-            outcomes_raw = data.get("outcomes", [])
-            if isinstance(outcomes_raw, str):
-                try:
-                    outcomes = json.loads(outcomes_raw)
-                except json.JSONDecodeError:
-                    logger.debug(
-                        f"Market {market_id} has invalid outcomes JSON, skipping"
-                    )
-                    return None
-            else:
-                outcomes = outcomes_raw
-
+            # Extract outcomes
+            outcomes = self._parse_list_field(
+                data.get("outcomes") or [], "outcomes", market_id
+            )
+            if outcomes is None:
+                return None
             if not outcomes or not isinstance(outcomes, list):
-                logger.debug(f"Market {market_id} has invalid outcomes, skipping")
+                logger.debug("Market %s has invalid outcomes, skipping", market_id)
                 return None
 
-            # Extract outcome prices - handle both string and list formats
-            outcome_prices_raw = data.get("outcomePrices", [])
-            if isinstance(outcome_prices_raw, str):
-                try:
-                    outcome_prices = json.loads(outcome_prices_raw)
-                except json.JSONDecodeError:
-                    logger.debug(
-                        f"Market {market_id} has invalid outcome prices JSON, skipping"
-                    )
-                    return None
-            else:
-                outcome_prices = outcome_prices_raw
-
+            # Extract outcome prices
+            outcome_prices = self._parse_list_field(
+                data.get("outcomePrices") or [], "outcome prices", market_id
+            )
+            if outcome_prices is None:
+                return None
             if not outcome_prices or len(outcome_prices) != len(outcomes):
                 logger.debug(
-                    f"Market {market_id} has mismatched outcome prices, skipping"
+                    "Market %s has mismatched outcome prices, skipping", market_id
                 )
                 return None
 
             # Convert outcome prices to floats
             outcome_prices = [float(price) for price in outcome_prices]
 
-            # Extract token IDs - handle both string and list formats
-            clob_token_ids_raw = data.get("clobTokenIds", [])
-            if isinstance(clob_token_ids_raw, str):
-                try:
-                    clob_token_ids = json.loads(clob_token_ids_raw)
-                except json.JSONDecodeError:
-                    logger.debug(
-                        f"Market {market_id} has invalid token IDs JSON, skipping"
-                    )
-                    return None
-            else:
-                clob_token_ids = clob_token_ids_raw
-
+            # Extract token IDs
+            clob_token_ids = self._parse_list_field(
+                data.get("clobTokenIds") or [], "token IDs", market_id
+            )
+            if clob_token_ids is None:
+                return None
             if not clob_token_ids:
-                logger.debug(f"Market {market_id} has no token IDs, skipping")
+                logger.debug("Market %s has no token IDs, skipping", market_id)
                 return None
 
             clob_token_ids = [str(token_id) for token_id in clob_token_ids]
 
             # Calculate age and time to resolution
-            now = datetime.now(timezone.utc)
             age_hours = None
             if start_date:
                 age_hours = (now - start_date).total_seconds() / 3600
@@ -208,7 +188,29 @@ class MarketFetcher:
             return market
 
         except Exception as e:
-            logger.debug(f"Error parsing market: {e}")
+            logger.debug("Error parsing market: %s", e)
+            return None
+
+    @staticmethod
+    def _parse_list_field(value: Any, field: str, market_id: str) -> Optional[Any]:
+        """
+        Decode a list field that Gamma may send as a JSON-encoded string.
+
+        Args:
+            value: Raw field value, either a list or its JSON string form.
+            field: Field description for the skip message, e.g. "outcomes".
+            market_id: Market the field belongs to, for the skip message.
+
+        Returns:
+            The decoded value, or None if the string is not valid JSON.
+        """
+        if not isinstance(value, str):
+            return value
+
+        try:
+            return from_json(value)
+        except ValueError:
+            logger.debug("Market %s has invalid %s JSON, skipping", market_id, field)
             return None
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
@@ -238,5 +240,5 @@ class MarketFetcher:
             return dt
 
         except Exception as e:
-            logger.debug(f"Failed to parse date '{date_str}': {e}")
+            logger.debug("Failed to parse date '%s': %s", date_str, e)
             return None
@@ -1,12 +1,30 @@
 """Stage 2: Multi-Stage Filtering - Filter markets for research potential."""
 
 import logging
+import re
 
 from agents.config import config
 from agents.models import Market
 
 logger = logging.getLogger(__name__)
 
+# Sports keywords to exclude
+_SPORTS_KEYWORDS = (
+    'vs.', 'vs ', 'game', 'team', 'score', 'win', 'lose', 'match', 'tournament',
+    'championship', 'league', 'season', 'playoff', 'final', 'semifinal',
+    'quarterfinal', 'round', 'bracket', 'steelers', 'bengals', 'rams', 'jaguars',
+    'saints', 'bears', 'dolphins', 'browns', 'raiders', 'chiefs', 'eagles',
+    'vikings', 'panthers', 'jets', 'patriots', 'titans', 'giants', 'broncos',
+    'colts', 'chargers', 'packers', 'cardinals', 'commanders', 'cowboys',
+    'falcons', '49ers', 'buccaneers', 'lions', 'texans', 'seahawks',
+    'brewers', 'dodgers', 'blue jays', 'mariners', 'osaka', 'cristian',
+    'worlds', 'lol', 'esports', 'football', 'baseball', 'basketball',
+    'soccer', 'hockey', 'tennis', 'golf', 'boxing', 'mma', 'ufc'
+)
+
+# Matches any sports keyword as a substring, in a single scan of the question
+_SPORTS_PATTERN = re.compile("|".join(map(re.escape, _SPORTS_KEYWORDS)))
+
 
 class MarketFilter:
     """
@@ -19,6 +37,7 @@ class MarketFilter:
 
     def __init__(self):
         self.config = config.filter
+        self.exclude_categories = frozenset(self.config.exclude_categories)
 
     def filter_markets(self, markets: list[Market]) -> list[Market]:
         """
@@ -49,36 +68,23 @@ class MarketFilter:
         """
         filtered = []
 
-        # Sports keywords to exclude
-        sports_keywords = [
-            'vs.', 'vs ', 'game', 'team', 'score', 'win', 'lose', 'match', 'tournament',
-            'championship', 'league', 'season', 'playoff', 'final', 'semifinal',
-            'quarterfinal', 'round', 'bracket', 'steelers', 'bengals', 'rams', 'jaguars',
-            'saints', 'bears', 'dolphins', 'browns', 'raiders', 'chiefs', 'eagles',
-            'vikings', 'panthers', 'jets', 'patriots', 'titans', 'giants', 'broncos',
-            'colts', 'chargers', 'packers', 'cardinals', 'commanders', 'cowboys',
-            'falcons', '49ers', 'buccaneers', 'lions', 'texans', 'seahawks',
-            'brewers', 'dodgers', 'blue jays', 'mariners', 'osaka', 'cristian',
-            'worlds', 'lol', 'esports', 'football', 'baseball', 'basketball',
-            'soccer', 'hockey', 'tennis', 'golf', 'boxing', 'mma', 'ufc'
-        ]
-
         for market in markets:
             # Check category if available
-            if market.category and market.category in self.config.exclude_categories:
+            if market.category and market.category in self.exclude_categories:
                 continue
             
             # Check for sports keywords in question
             question_lower = market.question.lower()
-            if any(keyword in question_lower for keyword in sports_keywords):
-                logger.debug(f"Excluding sports market: {market.question[:50]}...")
+            if _SPORTS_PATTERN.search(question_lower):
+                logger.debug("Excluding sports market: %.50s...", market.question)
                 continue
 
             filtered.append(market)
 
         logger.debug(
-            f"Category: {len(filtered)}/{len(markets)} passed "
-            f"(excluded sports by keywords)"
+            "Category: %d/%d passed (excluded sports by keywords)",
+            len(filtered),
+            len(markets),
         )
 
         return filtered
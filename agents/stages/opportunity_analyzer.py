@@ -1,12 +1,14 @@
 """Stage 5: Opportunity Analysis & Scoring - Compare model estimates to market prices."""
 
 import logging
-from typing import Optional
+from operator import attrgetter
+from typing import NamedTuple, Optional
 
 from agents.config import config
 from agents.models import (
     Market,
     Tier2Research,
+    Source,
     Opportunity,
     ConfidenceScore,
     InformationQuality,
@@ -15,6 +17,43 @@ from agents.models import (
 
 logger = logging.getLogger(__name__)
 
+_OPPORTUNITY_SCORE = attrgetter("opportunity_score")
+
+# Liquidity (USD) at which a market counts as fully liquid
+_FULL_LIQUIDITY = 10000.0
+
+# Source credibility scale and the threshold for a high-quality source
+_MAX_CREDIBILITY = 5.0
+_HIGH_CREDIBILITY = 4
+
+# Unique domains needed for full consensus credit
+_CONSENSUS_DOMAINS = 5.0
+
+# Score lookups used by the confidence calculation
+_INFORMATION_QUALITY_SCORES = {
+    InformationQuality.HIGH: 1.0,
+    InformationQuality.MEDIUM: 0.6,
+    InformationQuality.LOW: 0.3,
+}
+_CONFIDENCE_LEVEL_SCORES = {
+    ConfidenceLevel.HIGH: 1.0,
+    ConfidenceLevel.MEDIUM_HIGH: 0.8,
+    ConfidenceLevel.MEDIUM: 0.6,
+    ConfidenceLevel.LOW: 0.4,
+}
+
+# Confidence levels that raise a red flag or earn a green flag
+_LOW_CONFIDENCE_LEVELS = frozenset({ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM})
+_HIGH_CONFIDENCE_LEVELS = frozenset({ConfidenceLevel.HIGH, ConfidenceLevel.MEDIUM_HIGH})
+
+
+class SourceStats(NamedTuple):
+    """Aggregate statistics over a research result's sources."""
+
+    avg_credibility: float
+    unique_domains: int
+    high_quality: int
+
 
 class OpportunityAnalyzer:
     """
@@ -50,7 +89,10 @@ class OpportunityAnalyzer:
         edge = abs(model_prob - market_prob)
 
         logger.debug(
-            f"Edge calculation: model={model_prob:.2%}, market={market_prob:.2%}, edge={edge:.2%}"
+            "Edge calculation: model=%.2f%%, market=%.2f%%, edge=%.2f%%",
+            model_prob * 100,
+            market_prob * 100,
+            edge * 100,
         )
 
         # Check minimum edge threshold
@@ -58,9 +100,12 @@ class OpportunityAnalyzer:
             logger.info(f"Edge {edge:.2%} below threshold {self.config.min_edge_for_report:.2%}, skipping")
             return None
 
+        # Summarize sources once for scoring and flagging
+        source_stats = self._summarize_sources(research.sources)
+
         # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(research)
-        logger.debug(f"Confidence score: {confidence_score.overall_score:.2f}")
+        confidence_score = self._calculate_confidence_score(research, source_stats)
+        logger.debug("Confidence score: %.2f", confidence_score.overall_score)
 
         # Check minimum confidence
         if confidence_score.overall_score < self.config.min_confidence_score:
@@ -71,12 +116,12 @@ class OpportunityAnalyzer:
             return None
 
         # Calculate liquidity factor
-        liquidity_factor = min(1.0, market.liquidity / 10000.0)
+        liquidity_factor = min(1.0, market.liquidity / _FULL_LIQUIDITY)
 
         # Calculate opportunity score
         opportunity_score = edge * confidence_score.overall_score * liquidity_factor
 
-        logger.debug(f"Opportunity score: {opportunity_score:.4f}")
+        logger.debug("Opportunity score: %.4f", opportunity_score)
 
         # Check minimum opportunity score
         if opportunity_score < self.config.min_opportunity_score:
@@ -87,8 +132,8 @@ class OpportunityAnalyzer:
             return None
 
         # Identify flags
-        red_flags = self._identify_red_flags(market, research)
-        green_flags = self._identify_green_flags(market, research)
+        red_flags = self._identify_red_flags(market, research, source_stats)
+        green_flags = self._identify_green_flags(market, research, source_stats)
 
         # Generate recommendation
         recommendation = self._generate_recommendation(model_prob, market_prob, edge, confidence_score)
@@ -119,47 +164,63 @@ class OpportunityAnalyzer:
 
         return opportunity
 
-    def _calculate_confidence_score(self, research: Tier2Research) -> ConfidenceScore:
+    def _summarize_sources(self, sources: list[Source]) -> SourceStats:
+        """
+        Collect source statistics in a single pass.
+
+        Args:
+            sources: Research sources.
+
+        Returns:
+            SourceStats with average credibility, unique domain count and
+            number of high-credibility sources.
+        """
+        credibility_total = 0
+        high_quality = 0
+        domains = set()
+
+        for source in sources:
+            credibility_total += source.credibility
+            if source.credibility >= _HIGH_CREDIBILITY:
+                high_quality += 1
+            domains.add(source.url.split("/")[2])
+
+        return SourceStats(
+            avg_credibility=credibility_total / len(sources) if sources else 0,
+            unique_domains=len(domains),
+            high_quality=high_quality,
+        )
+
+    def _calculate_confidence_score(
+        self, research: Tier2Research, source_stats: SourceStats
+    ) -> ConfidenceScore:
         """
         Calculate confidence score based on multiple factors.
 
         Args:
             research: Research results.
+            source_stats: Source statistics from _summarize_sources.
 
         Returns:
             ConfidenceScore object.
         """
         # 1. Source Quality (0-1)
-        avg_source_credibility = (
-            sum(s.credibility for s in research.sources) / len(research.sources)
-            if research.sources
-            else 0
-        )
-        source_quality = avg_source_credibility / 5.0  # Normalize to 0-1
+        source_quality = source_stats.avg_credibility / _MAX_CREDIBILITY  # Normalize to 0-1
 
         # 2. Information Recency (0-1)
         # For now, use information quality as proxy
-        info_quality_map = {
-            InformationQuality.HIGH: 1.0,
-            InformationQuality.MEDIUM: 0.6,
-            InformationQuality.LOW: 0.3,
-        }
-        information_recency = info_quality_map[research.information_quality]
+        information_recency = _INFORMATION_QUALITY_SCORES[research.information_quality]
 
         # 3. Consensus Level (0-1)
         # Check source diversity
-        unique_domains = len(set(s.url.split("/")[2] for s in research.sources)) if research.sources else 0
-        consensus_level = min(1.0, unique_domains / 5.0)
+        unique_domains = source_stats.unique_domains
+        consensus_level = min(1.0, unique_domains / _CONSENSUS_DOMAINS)
 
         # 4. Base Rate Alignment (0-1)
         # For now, use model confidence level as proxy
-        confidence_map = {
-            ConfidenceLevel.HIGH: 1.0,
-            ConfidenceLevel.MEDIUM_HIGH: 0.8,
-            ConfidenceLevel.MEDIUM: 0.6,
-            ConfidenceLevel.LOW: 0.4,
-        }
-        base_rate_alignment = confidence_map[research.model_estimate.confidence_level]
+        base_rate_alignment = _CONFIDENCE_LEVEL_SCORES[
+            research.model_estimate.confidence_level
+        ]
 
         # 5. Reasoning Clarity (0-1)
         # Based on length and structure of reasoning
@@ -191,13 +252,16 @@ class OpportunityAnalyzer:
             overall_score=overall_score,
         )
 
-    def _identify_red_flags(self, market: Market, research: Tier2Research) -> list[str]:
+    def _identify_red_flags(
+        self, market: Market, research: Tier2Research, source_stats: SourceStats
+    ) -> list[str]:
         """
         Identify risk factors that should reduce confidence.
 
         Args:
             market: Market object.
             research: Research results.
+            source_stats: Source statistics from _summarize_sources.
 
         Returns:
             List of red flag descriptions.
@@ -206,7 +270,7 @@ class OpportunityAnalyzer:
 
         # Low source diversity
         if research.sources:
-            unique_domains = len(set(s.url.split("/")[2] for s in research.sources))
+            unique_domains = source_stats.unique_domains
             if unique_domains < 3:
                 red_flags.append(f"Low source diversity (only {unique_domains} unique sources)")
 
@@ -219,7 +283,7 @@ class OpportunityAnalyzer:
             red_flags.append(f"Wide confidence interval ({ci_width:.1%})")
 
         # Low model confidence
-        if research.model_estimate.confidence_level in [ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM]:
+        if research.model_estimate.confidence_level in _LOW_CONFIDENCE_LEVELS:
             red_flags.append(f"Low model confidence ({research.model_estimate.confidence_level.value})")
 
         # Low information quality
@@ -236,13 +300,16 @@ class OpportunityAnalyzer:
 
         return red_flags
 
-    def _identify_green_flags(self, market: Market, research: Tier2Research) -> list[str]:
+    def _identify_green_flags(
+        self, market: Market, research: Tier2Research, source_stats: SourceStats
+    ) -> list[str]:
         """
         Identify positive factors that increase confidence.
 
         Args:
             market: Market object.
             research: Research results.
+            source_stats: Source statistics from _summarize_sources.
 
         Returns:
             List of green flag descriptions.
@@ -251,21 +318,18 @@ class OpportunityAnalyzer:
 
         # High quality sources
         if research.sources:
-            high_quality = sum(1 for s in research.sources if s.credibility >= 4)
+            high_quality = source_stats.high_quality
             if high_quality >= 3:
                 green_flags.append(f"{high_quality} high-quality sources")
 
         # Good source diversity
         if research.sources:
-            unique_domains = len(set(s.url.split("/")[2] for s in research.sources))
+            unique_domains = source_stats.unique_domains
             if unique_domains >= 5:
                 green_flags.append(f"Good source diversity ({unique_domains} sources)")
 
         # High model confidence
-        if research.model_estimate.confidence_level in [
-            ConfidenceLevel.HIGH,
-            ConfidenceLevel.MEDIUM_HIGH,
-        ]:
+        if research.model_estimate.confidence_level in _HIGH_CONFIDENCE_LEVELS:
             green_flags.append(f"High model confidence ({research.model_estimate.confidence_level.value})")
 
         # Recent developments
@@ -277,7 +341,7 @@ class OpportunityAnalyzer:
             green_flags.append("High-quality information available")
 
         # Good liquidity
-        if market.liquidity > 10000:
+        if market.liquidity > _FULL_LIQUIDITY:
             green_flags.append(f"Good liquidity (${market.liquidity:,.0f})")
 
         # Multiple convergent findings
@@ -302,14 +366,9 @@ class OpportunityAnalyzer:
             Dictionary with action and outcome.
         """
         # Determine direction
-        if model_prob > market_prob:
-            action = "BUY"
-            outcome = "YES"
-            strength = "Strong" if edge > 0.15 and confidence.overall_score > 0.7 else "Moderate"
-        else:
-            action = "BUY"
-            outcome = "NO"
-            strength = "Strong" if edge > 0.15 and confidence.overall_score > 0.7 else "Moderate"
+        action = "BUY"
+        outcome = "YES" if model_prob > market_prob else "NO"
+        strength = "Strong" if edge > 0.15 and confidence.overall_score > 0.7 else "Moderate"
 
         return {
             "action": f"{strength} {action}",
@@ -326,4 +385,4 @@ class OpportunityAnalyzer:
         Returns:
             Sorted list of opportunities (highest score first).
         """
-        return sorted(opportunities, key=lambda o: o.opportunity_score, reverse=True)
+        return sorted(opportunities, key=_OPPORTUNITY_SCORE, reverse=True)
@@ -34,30 +34,39 @@ class ReportGenerator:
         """
         logger.info(f"Generating report with {len(opportunities)} opportunities")
 
-        # Categorize opportunities
-        high_priority = [o for o in opportunities if o.opportunity_score >= 0.10]
-        medium_priority = [
-            o for o in opportunities if 0.05 <= o.opportunity_score < 0.10
+        # Categorize opportunities in a single pass
+        high_priority = []
+        medium_priority = []
+        for opp in opportunities:
+            if opp.opportunity_score >= 0.10:
+                high_priority.append(opp)
+            elif opp.opportunity_score >= 0.05:
+                medium_priority.append(opp)
+
+        # Generate HTML sections and join them once at the end
+        sections = [
+            self._html_header(),
+            self._html_executive_summary(
+                run_date,
+                len(opportunities),
+                high_priority,
+                runtime_seconds,
+                estimated_cost,
+            ),
         ]
 
-        # Generate HTML sections
-        html = self._html_header()
-        html += self._html_executive_summary(
-            run_date, len(opportunities), high_priority, runtime_seconds, estimated_cost
-        )
-
         if high_priority:
-            html += self._html_high_priority_section(high_priority)
+            sections.append(self._html_high_priority_section(high_priority))
 
         if medium_priority:
-            html += self._html_medium_priority_section(medium_priority)
+            sections.append(self._html_medium_priority_section(medium_priority))
 
         if errors:
-            html += self._html_errors_section(errors)
+            sections.append(self._html_errors_section(errors))
 
-        html += self._html_footer(run_date, runtime_seconds)
+        sections.append(self._html_footer(run_date, runtime_seconds))
 
-        return html
+        return "".join(sections)
 
     def _html_header(self) -> str:
         """Generate HTML header with email-compatible styles."""
@@ -254,8 +263,14 @@ class ReportGenerator:
         estimated_cost: float,
     ) -> str:
         """Generate executive summary section."""
-        highest_score = max([o.opportunity_score for o in high_priority], default=0)
-        highest_edge = max([o.edge for o in high_priority], default=0)
+        # Track both maxima in one pass over the opportunities
+        highest_score = 0
+        highest_edge = 0
+        for opp in high_priority:
+            if opp.opportunity_score > highest_score:
+                highest_score = opp.opportunity_score
+            if opp.edge > highest_edge:
+                highest_edge = opp.edge
 
         return f"""
         <h1>Polymarket Trading Opportunities</h1>
@@ -279,10 +294,7 @@ class ReportGenerator:
         <p>These opportunities show strong potential based on research and model estimates.</p>
 """
 
-        for opp in opportunities:
-            html += self._html_opportunity_card(opp)
-
-        return html
+        return html + "".join(self._html_opportunity_card(opp) for opp in opportunities)
 
     def _html_medium_priority_section(self, opportunities: list[Opportunity]) -> str:
         """Generate medium priority opportunities section."""
@@ -291,10 +303,9 @@ class ReportGenerator:
         <p>These opportunities show moderate potential and may be worth monitoring.</p>
 """
 
-        for opp in opportunities:
-            html += self._html_opportunity_card(opp, priority="medium")
-
-        return html
+        return html + "".join(
+            self._html_opportunity_card(opp, priority="medium") for opp in opportunities
+        )
 
     def _html_opportunity_card(self, opp: Opportunity, priority: str = "high") -> str:
         """Generate HTML for a single opportunity."""
@@ -310,17 +321,20 @@ class ReportGenerator:
         """
 
         # Prepare flags
-        flags_html = ""
-        for flag in opp.green_flags:
-            flags_html += f'<span class="flag green">✓ {flag}</span>'
-        for flag in opp.red_flags:
-            flags_html += f'<span class="flag red">⚠ {flag}</span>'
+        flags_html = "".join(
+            [f'<span class="flag green">✓ {flag}</span>' for flag in opp.green_flags]
+            + [f'<span class="flag red">⚠ {flag}</span>' for flag in opp.red_flags]
+        )
 
         # Key findings
-        findings_html = "<ul>"
-        for finding in opp.tier2_research.key_findings[:5]:
-            findings_html += f"<li>{finding.finding[:200]}...</li>"
-        findings_html += "</ul>"
+        findings_html = (
+            "<ul>"
+            + "".join(
+                f"<li>{finding.finding[:200]}...</li>"
+                for finding in opp.tier2_research.key_findings[:5]
+            )
+            + "</ul>"
+        )
 
         return f"""
         <div class="{class_name}">
@@ -353,8 +367,9 @@ class ReportGenerator:
         <div class="error-box">
             <ul>
 """
-        for error in errors[:10]:  # Limit to 10 errors
-            html += f"<li>{error}</li>"
+        html += "".join(
+            f"<li>{error}</li>" for error in errors[:10]  # Limit to 10 errors
+        )
 
         html += """
             </ul>
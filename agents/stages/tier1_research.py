@@ -1,23 +1,50 @@
 """Stage 3: Tier 1 Research - Fast context gathering for filtered markets."""
 
+import heapq
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 
-import anthropic
 from typing import Any
-try:
-    from openai import OpenAI  # type: ignore
-except Exception:  # OpenAI optional
-    OpenAI = None  # type: ignore
-from tavily import TavilyClient
 
+from agents.clients import (
+    HAS_OPENAI,
+    get_anthropic_client,
+    get_openai_client,
+    get_tavily_client,
+)
 from agents.config import config
-from agents.models import Market, Tier1Research, Source
+from agents.models import Market, Tier1Research, Source, source_rank
+from agents.stages.concurrency import research_concurrently
 
 logger = logging.getLogger(__name__)
 
+# Summary keywords indicating recent developments
+_RECENT_KEYWORDS = (
+    "recent",
+    "just",
+    "announced",
+    "yesterday",
+    "today",
+    "breaking",
+    "new",
+    "latest",
+)
+
+# Summary keywords suggesting the market may be mispriced
+_MISPRICING_KEYWORDS = (
+    "underestimate",
+    "overestimate",
+    "likely",
+    "unlikely",
+    "probable",
+    "improbable",
+    "expect",
+    "unexpected",
+)
+
 
 class Tier1Researcher:
     """
@@ -32,14 +59,12 @@ class Tier1Researcher:
 
     def __init__(self):
         self.config = config.research
-        self.use_openai = bool(getattr(config.api, "openai_api_key", None)) and OpenAI is not None
+        self.use_openai = bool(getattr(config.api, "openai_api_key", None)) and HAS_OPENAI
         if self.use_openai:
-            self.openai_client = OpenAI(api_key=getattr(config.api, "openai_api_key", None))  # type: ignore
+            self.openai_client = get_openai_client()
         else:
-            self.anthropic_client = anthropic.Anthropic(
-                api_key=config.api.anthropic_api_key
-            )
-        self.tavily_client = TavilyClient(api_key=config.api.tavily_api_key)
+            self.anthropic_client = get_anthropic_client()
+        self.tavily_client = get_tavily_client()
 
     def research_market(self, market: Market) -> Tier1Research:
         """
@@ -57,11 +82,11 @@ class Tier1Researcher:
 
         # Step 1: Form search queries
         queries = self._form_search_queries(market)
-        logger.debug(f"Generated queries: {queries}")
+        logger.debug("Generated queries: %s", queries)
 
         # Step 2: Run searches
         sources = self._run_searches(queries)
-        logger.debug(f"Found {len(sources)} sources")
+        logger.debug("Found %d sources", len(sources))
 
         # Step 3: Quick LLM analysis
         analysis = self._analyze_context(market, sources)
@@ -92,6 +117,22 @@ class Tier1Researcher:
 
         return research
 
+    def research_markets(
+        self, markets: list[Market]
+    ) -> list[Union[Tier1Research, Exception]]:
+        """
+        Perform Tier 1 research on up to `tier1_concurrency` markets at once.
+
+        Args:
+            markets: Markets to research.
+
+        Returns:
+            Tier1Research results or exceptions, in input order.
+        """
+        return research_concurrently(
+            self.research_market, markets, self.config.tier1_concurrency, "Researching"
+        )
+
     def _form_search_queries(self, market: Market) -> list[str]:
         """
         Form 2-3 targeted search queries based on the market question.
@@ -168,44 +209,54 @@ Generate 2-3 search queries that would help research this question."""
         all_sources = []
         seen_urls = set()
 
-        for query in queries:
+        # Searches are independent network calls, so issue them concurrently
+        # and consume results in query order to keep deduplication stable
+        max_workers = max(1, min(self.config.search_concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             try:
-                # Use Tavily for web search
-                search_result = self.tavily_client.search(
-                    query=query,
-                    max_results=5,
-                )
-
-                for result in search_result.get("results", []):
-                    url = result.get("url")
-                    if url in seen_urls:
-                        continue
-
-                    seen_urls.add(url)
-
-                    source = Source(
-                        url=url,
-                        title=result.get("title", ""),
-                        credibility=self._estimate_source_credibility(),
-                        date=None,  # Tavily doesn't always provide dates
-                        snippet=result.get("content", "")[:500],
-                        relevance_score=result.get("score"),
+                futures = [
+                    executor.submit(
+                        self.tavily_client.search, query=query, max_results=5
                     )
-
-                    all_sources.append(source)
-
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {e}")
-                continue
-
-        # Sort by relevance and credibility
-        all_sources.sort(
-            key=lambda s: (s.credibility, s.relevance_score or 0), reverse=True
+                    for query in queries
+                ]
+
+                for query, future in zip(queries, futures):
+                    try:
+                        # Use Tavily for web search
+                        search_result = future.result()
+
+                        for result in search_result.get("results", []):
+                            url = result.get("url")
+                            if url in seen_urls:
+                                continue
+
+                            seen_urls.add(url)
+
+                            source = Source(
+                                url=url,
+                                title=result.get("title", ""),
+                                credibility=self._estimate_source_credibility(),
+                                date=None,  # Tavily doesn't always provide dates
+                                snippet=result.get("content", "")[:500],
+                                relevance_score=result.get("score"),
+                            )
+
+                            all_sources.append(source)
+
+                    except Exception as e:
+                        logger.warning(f"Search failed for query '{query}': {e}")
+                        continue
+            except BaseException:
+                # On Ctrl+C, drop queued searches instead of letting the
+                # pool run them all before the interrupt takes effect
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return heapq.nlargest(
+            self.config.tier1_max_sources, all_sources, key=source_rank
         )
 
-        # Limit to max sources
-        return all_sources[: self.config.tier1_max_sources]
-
     def _estimate_source_credibility(self) -> int:
         """
         Estimate source credibility (1-5) based on URL.
@@ -287,18 +338,9 @@ Provide your analysis."""
                 summary = response.content[0].text.strip()
 
             # Check for keywords indicating recent developments
-            recent_keywords = [
-                "recent",
-                "just",
-                "announced",
-                "yesterday",
-                "today",
-                "breaking",
-                "new",
-                "latest",
-            ]
+            summary_lower = summary.lower()
             recent_developments = any(
-                keyword in summary.lower() for keyword in recent_keywords
+                keyword in summary_lower for keyword in _RECENT_KEYWORDS
             )
 
             return {"summary": summary, "recent_developments": recent_developments}
@@ -353,19 +395,8 @@ Provide your analysis."""
             proceed = True
 
         # Check 4: Look for keywords suggesting mispricing
-        mispricing_keywords = [
-            "underestimate",
-            "overestimate",
-            "likely",
-            "unlikely",
-            "probable",
-            "improbable",
-            "expect",
-            "unexpected",
-        ]
-
         summary_lower = analysis.get("summary", "").lower()
-        if any(keyword in summary_lower for keyword in mispricing_keywords):
+        if any(keyword in summary_lower for keyword in _MISPRICING_KEYWORDS):
             reasoning_parts.append("Analysis suggests potential mispricing")
             proceed = True
 
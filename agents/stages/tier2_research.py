@@ -1,18 +1,23 @@
 """Stage 4: Tier 2 Research - Deep analysis for promising markets."""
 
+import heapq
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 
-import anthropic
-import requests
-try:
-    from openai import OpenAI  # type: ignore
-except Exception:
-    OpenAI = None  # type: ignore
-from tavily import TavilyClient
+from pydantic import BaseModel
+from pydantic_core import from_json
 
+from agents.clients import (
+    HAS_OPENAI,
+    get_anthropic_client,
+    get_openai_client,
+    get_perplexity_session,
+    get_tavily_client,
+)
 from agents.config import config
 from agents.models import (
     Market,
@@ -22,10 +27,29 @@ from agents.models import (
     ProbabilityEstimate,
     ConfidenceLevel,
     InformationQuality,
+    source_rank,
 )
+from agents.stages.concurrency import research_concurrently
 
 logger = logging.getLogger(__name__)
 
+_PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+
+# Bulleted or numbered items in the risks section of an analysis
+_RISK_ITEM_PATTERN = re.compile(r"[-•\d]+[.)]\s*(.+?)(?=[-•\d]+[.)]|$)", re.DOTALL)
+
+# Phrases that mark a query as exploring the contrarian case
+_NEGATIVE_QUERY_KEYWORDS = ("why not", "won't", "unlikely", "fail")
+
+
+class _ProbabilityReply(BaseModel):
+    """Probability estimate as returned by the extraction prompt."""
+
+    yes_probability: float = 0.5
+    confidence_interval_low: float = 0.4
+    confidence_interval_high: float = 0.6
+    confidence_level: ConfidenceLevel = ConfidenceLevel.MEDIUM
+
 
 class Tier2Researcher:
     """
@@ -42,16 +66,14 @@ class Tier2Researcher:
     def __init__(self):
         self.config = config.research
         self.use_perplexity = bool(getattr(config.api, "perplexity_api_key", None))
-        self.use_openai = (not self.use_perplexity) and bool(getattr(config.api, "openai_api_key", None)) and OpenAI is not None
+        self.use_openai = (not self.use_perplexity) and bool(getattr(config.api, "openai_api_key", None)) and HAS_OPENAI
         if self.use_perplexity:
-            self.perplexity_api_key = getattr(config.api, "perplexity_api_key", None)
+            self.perplexity_session = get_perplexity_session()
         elif self.use_openai:
-            self.openai_client = OpenAI(api_key=getattr(config.api, "openai_api_key", None))  # type: ignore
+            self.openai_client = get_openai_client()
         else:
-            self.anthropic_client = anthropic.Anthropic(
-                api_key=config.api.anthropic_api_key
-            )
-        self.tavily_client = TavilyClient(api_key=config.api.tavily_api_key)
+            self.anthropic_client = get_anthropic_client()
+        self.tavily_client = get_tavily_client()
 
     def research_market(self, market: Market) -> Tier2Research:
         """
@@ -69,11 +91,11 @@ class Tier2Researcher:
 
         # Step 1: Comprehensive information gathering
         sources = self._comprehensive_search(market)
-        logger.debug(f"Gathered {len(sources)} sources")
+        logger.debug("Gathered %d sources", len(sources))
 
         # Step 2: Assess source quality
         info_quality = self._assess_information_quality(sources)
-        logger.debug(f"Information quality: {info_quality}")
+        logger.debug("Information quality: %s", info_quality)
 
         # Step 3: Deep analysis with premium LLM
         analysis = self._deep_analysis(market, sources)
@@ -108,6 +130,25 @@ class Tier2Researcher:
 
         return research
 
+    def research_markets(
+        self, markets: list[Market]
+    ) -> list[Union[Tier2Research, Exception]]:
+        """
+        Perform Tier 2 research on up to `tier2_concurrency` markets at once.
+
+        Args:
+            markets: Markets to research.
+
+        Returns:
+            Tier2Research results or exceptions, in input order.
+        """
+        return research_concurrently(
+            self.research_market,
+            markets,
+            self.config.tier2_concurrency,
+            "Deep research",
+        )
+
     def _comprehensive_search(self, market: Market) -> list[Source]:
         """
         Comprehensive information gathering with diverse search strategy.
@@ -120,56 +161,61 @@ class Tier2Researcher:
         """
         # Generate diverse queries
         queries = self._generate_comprehensive_queries(market)
-        logger.debug(f"Generated {len(queries)} comprehensive queries")
+        logger.debug("Generated %d comprehensive queries", len(queries))
 
         all_sources = []
         seen_urls = set()
 
-        for query in queries:
+        # Fan the queries out concurrently; results are consumed in query
+        # order so deduplication matches a sequential run
+        max_workers = max(1, min(self.config.search_concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             try:
-                # Use Tavily with different time windows
-                search_params = {
-                    "query": query,
-                    "search_depth": "advanced",
-                    "max_results": 5,
-                }
-
-                search_result = self.tavily_client.search(**search_params)
-
-                for result in search_result.get("results", []):
-                    url = result.get("url")
-                    if url in seen_urls:
-                        continue
+                futures = [
+                    executor.submit(
+                        self.tavily_client.search,
+                        query=query,
+                        search_depth="advanced",
+                        max_results=5,
+                    )
+                    for query in queries
+                ]
 
-                    seen_urls.add(url)
+                for query, future in zip(queries, futures):
+                    try:
+                        search_result = future.result()
 
-                    source = Source(
-                        url=url,
-                        title=result.get("title", ""),
-                        credibility=self._estimate_source_credibility(),
-                        date=None,
-                        snippet=result.get("content", "")[:1000],
-                        relevance_score=result.get("score"),
-                    )
+                        for result in search_result.get("results", []):
+                            url = result.get("url")
+                            if url in seen_urls:
+                                continue
 
-                    all_sources.append(source)
+                            seen_urls.add(url)
 
-                # Break after first successful search per query
-                if search_result.get("results"):
-                    break
+                            source = Source(
+                                url=url,
+                                title=result.get("title", ""),
+                                credibility=self._estimate_source_credibility(),
+                                date=None,
+                                snippet=result.get("content", "")[:1000],
+                                relevance_score=result.get("score"),
+                            )
 
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {e}")
-                continue
+                            all_sources.append(source)
 
-        # Sort by credibility and relevance
-        all_sources.sort(
-            key=lambda s: (s.credibility, s.relevance_score or 0), reverse=True
+                    except Exception as e:
+                        logger.warning(f"Search failed for query '{query}': {e}")
+                        continue
+            except BaseException:
+                # On Ctrl+C, drop queued searches instead of letting the
+                # pool run them all before the interrupt takes effect
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return heapq.nlargest(
+            self.config.tier2_max_sources, all_sources, key=source_rank
         )
 
-        # Return top sources
-        return all_sources[: self.config.tier2_max_sources]
-
     def _generate_comprehensive_queries(self, market: Market) -> list[str]:
         """
         Generate 5-8 diverse search queries including contrarian views.
@@ -227,9 +273,9 @@ Generate 5-8 comprehensive search queries."""
             queries = [q.strip() for q in queries_text.split("\n") if q.strip()]
 
             # Ensure we have at least one negative query
+            queries_lower = " ".join(queries).lower()
             has_negative = any(
-                keyword in " ".join(queries).lower()
-                for keyword in ["why not", "won't", "unlikely", "fail"]
+                keyword in queries_lower for keyword in _NEGATIVE_QUERY_KEYWORDS
             )
 
             if not has_negative and len(queries) < self.config.tier2_queries_per_market:
@@ -327,44 +373,15 @@ RESEARCH SOURCES:
 Provide your comprehensive analysis."""
 
         try:
-            if self.use_perplexity:
-                # Use Perplexity Sonar Deep Research for deep analysis
-                headers = {
-                    "Authorization": f"Bearer {self.perplexity_api_key}",
-                    "Content-Type": "application/json",
-                }
-                payload = {
-                    "model": config.research.tier2_model_perplexity or "sonar-deep-research",
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                }
-                resp = requests.post("https://api.perplexity.ai/chat/completions", headers=headers, json=payload, timeout=600)
-                resp.raise_for_status()
-                data = resp.json()
-                analysis_text = (data.get("choices", [{}])[0].get("message", {}).get("content") or "").strip()
-            elif self.use_openai:
-                response = self.openai_client.chat.completions.create(
-                    model=self.config.tier2_model_openai or "gpt-4o",
-                    max_tokens=2000,
-                    temperature=0.2,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                )
-                analysis_text = (response.choices[0].message.content or "").strip()
-            else:
-                response = self.anthropic_client.messages.create(
-                    model=self.config.tier2_model,
-                    max_tokens=2000,
-                    temperature=0.2,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_prompt}],
-                )
-
-                analysis_text = response.content[0].text.strip()
+            # Perplexity Sonar Deep Research runs its own research, so it gets
+            # the longer timeout
+            analysis_text = self._complete(
+                system_prompt,
+                user_prompt,
+                max_tokens=2000,
+                temperature=0.2,
+                perplexity_timeout=600,
+            ).strip()
 
             # Parse the analysis (simple parsing for now)
             return self._parse_analysis(analysis_text)
@@ -378,6 +395,68 @@ Provide your comprehensive analysis."""
                 "risks": [],
             }
 
+    def _complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+        perplexity_timeout: float,
+        json_output: bool = False,
+    ) -> str:
+        """
+        Run one chat completion against the configured Tier 2 provider.
+
+        Args:
+            system_prompt: System instructions.
+            user_prompt: User message.
+            max_tokens: Output token limit (OpenAI and Anthropic).
+            temperature: Sampling temperature (OpenAI and Anthropic).
+            perplexity_timeout: Request timeout in seconds for Perplexity.
+            json_output: Constrain OpenAI to emit a JSON object. The prompt
+                must mention JSON.
+
+        Returns:
+            The completion text, or an empty string if the model returned none.
+        """
+        if self.use_perplexity:
+            payload = {
+                "model": config.research.tier2_model_perplexity or "sonar-deep-research",
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+            }
+            resp = self.perplexity_session.post(
+                _PERPLEXITY_URL, json=payload, timeout=perplexity_timeout
+            )
+            resp.raise_for_status()
+            data = from_json(resp.content)
+            return data.get("choices", [{}])[0].get("message", {}).get("content") or ""
+
+        if self.use_openai:
+            extra = {"response_format": {"type": "json_object"}} if json_output else {}
+            response = self.openai_client.chat.completions.create(
+                model=self.config.tier2_model_openai or "gpt-4o",
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                **extra,
+            )
+            return response.choices[0].message.content or ""
+
+        response = self.anthropic_client.messages.create(
+            model=self.config.tier2_model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        return response.content[0].text
+
     def _parse_analysis(self, analysis_text: str) -> dict:
         """Parse the analysis text into structured components."""
         # Simple section extraction
@@ -392,15 +471,11 @@ Provide your comprehensive analysis."""
         sections["reasoning"] = analysis_text
 
         # Try to extract risks section
-        if "risk" in analysis_text.lower():
-            risk_start = analysis_text.lower().find("risk")
+        risk_start = analysis_text.lower().find("risk")
+        if risk_start != -1:
             risk_section = analysis_text[risk_start : risk_start + 500]
             # Extract bullet points or numbered items
-            import re
-
-            risks = re.findall(
-                r"[-•\d]+[.)]\s*(.+?)(?=[-•\d]+[.)]|$)", risk_section, re.DOTALL
-            )
+            risks = _RISK_ITEM_PATTERN.findall(risk_section)
             sections["risks"] = [r.strip() for r in risks if r.strip()][:5]
 
         return sections
@@ -465,59 +540,20 @@ Extract the probability estimate for the FIRST outcome ("{market.outcomes[0]}").
 Return JSON only."""
 
         try:
-            if self.use_perplexity:
-                headers = {
-                    "Authorization": f"Bearer {self.perplexity_api_key}",
-                    "Content-Type": "application/json",
-                }
-                payload = {
-                    "model": config.research.tier2_model_perplexity or "sonar-deep-research",
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                }
-                resp = requests.post("https://api.perplexity.ai/chat/completions", headers=headers, json=payload, timeout=300)
-                resp.raise_for_status()
-                data = resp.json()
-                import json
-                result = json.loads((data.get("choices", [{}])[0].get("message", {}).get("content") or "{}"))
-            elif self.use_openai:
-                response = self.openai_client.chat.completions.create(
-                    model=self.config.tier2_model_openai or "gpt-4o",
-                    max_tokens=200,
-                    temperature=0.1,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                )
-                import json
-                result = json.loads((response.choices[0].message.content or "{}"))
-            else:
-                response = self.anthropic_client.messages.create(
-                    model=self.config.tier2_model,
-                    max_tokens=200,
-                    temperature=0.1,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_prompt}],
-                )
+            reply_text = self._complete(
+                system_prompt,
+                user_prompt,
+                max_tokens=200,
+                temperature=0.1,
+                perplexity_timeout=300,
+                json_output=True,
+            )
 
-                import json
-                result = json.loads(response.content[0].text)
+            # Parse and coerce the reply in one pass; missing fields take the
+            # reply model's defaults
+            reply = _ProbabilityReply.model_validate_json(reply_text or "{}")
 
-            return ProbabilityEstimate(
-                yes_probability=float(result.get("yes_probability", 0.5)),
-                confidence_interval_low=float(
-                    result.get("confidence_interval_low", 0.4)
-                ),
-                confidence_interval_high=float(
-                    result.get("confidence_interval_high", 0.6)
-                ),
-                confidence_level=ConfidenceLevel(
-                    result.get("confidence_level", "medium")
-                ),
-            )
+            return ProbabilityEstimate(**reply.model_dump())
 
         except Exception as e:
             logger.warning(f"Failed to extract probability: {e}, using default")
@@ -14,8 +14,8 @@ Usage:
 import argparse
 import logging
 import sys
+from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
-from datetime import datetime
 
 from agents.config import config
 from agents.scheduler import DailyScheduler
@@ -35,12 +35,14 @@ def setup_logging():
 
     simple_formatter = logging.Formatter(fmt="%(levelname)s: %(message)s")
 
-    # File handler (detailed logs)
-    log_file = (
-        log_dir
-        / f"{config.logging.log_file_prefix}_{datetime.now().strftime('%Y%m%d')}.log"
+    # File handler (detailed logs), rotated daily so scheduled runs keep a
+    # bounded history on disk
+    log_file = log_dir / f"{config.logging.log_file_prefix}.log"
+    file_handler = TimedRotatingFileHandler(
+        log_file,
+        when="midnight",
+        backupCount=config.logging.log_retention_days,
     )
-    file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
 